@@ -5,15 +5,23 @@ This template demonstrates how to perform EDA on Bitcoin and Polymarket data
 using Polars with lazy evaluation for efficient data processing.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime
+from functools import cache
 from pathlib import Path
-from typing import Optional
+from types import ModuleType
+from typing import TYPE_CHECKING, Optional, Sequence, Union
 
-import matplotlib.pyplot as plt
+import numpy as np
 import polars as pl
+import polars.selectors as cs
 import psutil
-import seaborn as sns
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
 
 # --- Configuration ---
 # Robustly determine the project root directory
@@ -24,6 +32,34 @@ PLOTS_DIR = SCRIPT_DIR / "plots"
 COINMETRICS_PATH = DATA_DIR / "Coin Metrics" / "coinmetrics_btc.csv"
 POLYMARKET_DIR = DATA_DIR / "Polymarket"
 
+# Output plot paths
+BTC_CORR_PNG = PLOTS_DIR / "btc_correlation_matrix.png"
+BTC_PRICE_PNG = PLOTS_DIR / "btc_price_history.png"
+POLY_VOLUME_PNG = PLOTS_DIR / "polymarket_volume_by_category.png"
+
+# Let Agg simplify and chunk long line paths (dense time series). Applied with
+# rc_context around each plot so the caller's global rcParams are untouched.
+PLOT_RC_PARAMS = {
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+}
+
+# Scratch-quality PNG output: lower DPI and fast, light zlib compression
+SAVEFIG_KWARGS = {"dpi": 72, "pil_kwargs": {"optimize": False, "compress_level": 1}}
+
+# Coin Metrics columns consumed by the analysis/plotting functions below
+BTC_COLUMNS = ["time", "PriceUSD", "CapMrktCurUSD", "HashRate", "TxCnt"]
+
+# Upper bound on points passed to matplotlib for line plots
+PLOT_MAX_POINTS = 2000
+
+# Polymarket market columns consumed by the analysis/plotting functions below
+MARKETS_COLUMNS = ["created_at", "end_date", "active", "volume", "category"]
+
+# Low-cardinality Polymarket market columns stored as Categorical
+MARKETS_CATEGORICAL_COLUMNS = ["category"]
+
 # Create plots directory if it doesn't exist
 PLOTS_DIR.mkdir(exist_ok=True)
 
@@ -86,24 +122,154 @@ def track_memory(operation_name: str):
 # --- Data Loading Functions ---
 
 
+def _fix_timestamp_columns(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    Lazily repair corrupted Polymarket timestamp columns.
+
+    Columns whose maximum falls before 2020 are rescaled by 1000 (milliseconds
+    stored as microseconds), then any remaining pre-2020 placeholders are
+    replaced with null. The fix is applied when the frame is collected.
+
+    Args:
+        lf: Polars LazyFrame scanned from a Polymarket parquet file
+
+    Returns:
+        LazyFrame with the timestamp fix applied to matching columns
+    """
+    fixes = []
+    for col, dtype in lf.collect_schema().items():
+        if not any(x in col.lower() for x in ["timestamp", "trade", "created_at", "end_date"]):
+            continue
+        if dtype == pl.Datetime or dtype == pl.Date:
+            rescaled = (
+                pl.when(pl.col(col).max() < datetime(2020, 1, 1))
+                .then((pl.col(col).cast(pl.Int64) * 1000).cast(pl.Datetime))
+                .otherwise(pl.col(col))
+            )
+            # Enforce 2020+ constraint (replace placeholders/zeros with null)
+            fixes.append(
+                pl.when(rescaled < datetime(2020, 1, 1))
+                .then(None)
+                .otherwise(rescaled)
+                .alias(col)
+            )
+    return lf.with_columns(fixes) if fixes else lf
+
+
+def _row_count_query(path: Path) -> pl.LazyFrame:
+    """
+    Build a query counting the rows of a parquet file.
+
+    The count runs on the raw scan: the ``with_columns`` added by
+    ``_fix_timestamp_columns`` keeps Polars from answering ``len()`` from
+    the parquet footer (its FAST COUNT plan) and forces a column read.
+
+    Args:
+        path: Path to the parquet file
+
+    Returns:
+        One-row LazyFrame with the row count in column "len"
+    """
+    return pl.scan_parquet(path).select(pl.len())
+
+
+def _to_categorical(df: pl.DataFrame, columns: Sequence[str]) -> pl.DataFrame:
+    """
+    Convert low-cardinality string columns to Categorical after loading.
+
+    Numeric columns are deliberately left at full width: Polars does not widen
+    narrow integers in ``sum()``/``cum_sum()``, so downcasting counts risks
+    overflow, and float sums over prices/volumes need float64 precision.
+
+    Args:
+        df: Polars DataFrame to convert
+        columns: Low-cardinality string columns to make Categorical (missing
+            or non-string columns are skipped)
+
+    Returns:
+        DataFrame with the given columns stored as Categorical
+    """
+    return df.with_columns(
+        (cs.by_name(*columns, require_all=False) & cs.string()).cast(pl.Categorical)
+    )
+
+
+def _is_cache_fresh(cache_path: Path, source_path: Path) -> bool:
+    """
+    Check whether a cached file exists and is at least as new as its source.
+
+    Args:
+        cache_path: Path to the cached file
+        source_path: Path to the file the cache was built from
+
+    Returns:
+        True if the cache can be used in place of the source file
+    """
+    if not cache_path.exists() or not source_path.exists():
+        return False
+    return cache_path.stat().st_mtime >= source_path.stat().st_mtime
+
+
+def _btc_columns_in(filepath: Path) -> list[str]:
+    """
+    List the ``BTC_COLUMNS`` present in a Coin Metrics CSV.
+
+    Matches the projection in ``load_bitcoin_data`` (file order, missing
+    columns skipped). Only the header is read.
+
+    Args:
+        filepath: Path to the Coin Metrics CSV file
+
+    Returns:
+        Column names the loader would select from the file
+    """
+    header = pl.scan_csv(filepath, infer_schema_length=0).collect_schema().names()
+    return [col for col in header if col in BTC_COLUMNS]
+
+
 def load_bitcoin_data(filepath: Path) -> Optional[pl.DataFrame]:
     """
     Load Bitcoin data from CSV using Polars lazy scan.
 
+    Only the columns listed in ``BTC_COLUMNS`` are read; projection pushdown
+    lets the CSV reader skip parsing the remaining Coin Metrics columns.
+    The parsed frame is cached next to the CSV as a Feather (Arrow IPC) file
+    and reused on later runs until the CSV is modified or the selected
+    columns change. The cache is read into memory rather than memory-mapped and is
+    replaced atomically, so frames from earlier loads stay valid when it is
+    rebuilt.
+
     Args:
         filepath: Path to the Coin Metrics CSV file
 
     Returns:
         Polars DataFrame with parsed datetime column, or None if loading fails
     """
-    print(f"Loading Bitcoin data from {filepath}...")
+    cache_path = filepath.with_suffix(".feather")
     try:
         with track_memory("loading Bitcoin data"):
-            df = (
-                pl.scan_csv(filepath, infer_schema_length=10000)
-                .with_columns(pl.col("time").str.to_datetime())
-                .collect()
-            )
+            if (
+                _is_cache_fresh(cache_path, filepath)
+                and list(pl.read_ipc_schema(cache_path)) == _btc_columns_in(filepath)
+            ):
+                print(f"Loading Bitcoin data from cache {cache_path}...")
+                df = pl.read_ipc(cache_path, memory_map=False)
+            else:
+                print(f"Loading Bitcoin data from {filepath}...")
+                df = (
+                    pl.scan_csv(filepath, infer_schema_length=10000)
+                    .select(cs.by_name(*BTC_COLUMNS, require_all=False))
+                    .with_columns(pl.col("time").str.to_datetime())
+                    .collect()
+                )
+                # Write to a temporary file and swap it in, so readers never
+                # see a partially written cache
+                tmp_cache_path = cache_path.with_suffix(".feather.tmp")
+                try:
+                    df.write_ipc(tmp_cache_path)
+                    os.replace(tmp_cache_path, cache_path)
+                except OSError as e:
+                    print(f"Warning: could not write Bitcoin data cache: {e}")
         print(f"Successfully loaded {len(df)} rows.")
         return df
     except Exception as e:
@@ -111,103 +277,61 @@ def load_bitcoin_data(filepath: Path) -> Optional[pl.DataFrame]:
         return None
 
 
-def load_polymarket_data(datadir: Path) -> Optional[dict[str, pl.DataFrame]]:
+def load_polymarket_data(
+    datadir: Path,
+) -> Optional[dict[str, Union[pl.DataFrame, pl.LazyFrame]]]:
     """
     Load Polymarket data from parquet files using Polars lazy scan.
 
+    Markets are collected eagerly (only the columns in ``MARKETS_COLUMNS``);
+    the odds history and summary tables are returned as LazyFrames so that
+    callers only materialize the aggregates they need.
+
     Args:
         datadir: Directory containing Polymarket parquet files
 
     Returns:
-        Dictionary mapping data type names to Polars DataFrames, or None if loading fails
+        Dictionary mapping data type names to Polars DataFrames ("markets",
+        plus a one-row "row_counts" frame with the odds/summary row counts)
+        or LazyFrames ("odds", "summary"), or None if loading fails
     """
     print(f"Loading Polymarket data from {datadir}...")
     markets_path = datadir / "finance_politics_markets.parquet"
     odds_path = datadir / "finance_politics_odds_history.parquet"
     summary_path = datadir / "finance_politics_summary.parquet"
 
-    data: dict[str, pl.DataFrame] = {}
+    data: dict[str, Union[pl.DataFrame, pl.LazyFrame]] = {}
+    row_counts: dict[str, int] = {}
 
     try:
         with track_memory("loading Polymarket data"):
             if markets_path.exists():
-                # Load with lazy scan, then collect and handle datetime columns
-                markets_df = pl.scan_parquet(markets_path).collect()
-                
-                # Convert datetime columns only if they exist and are strings
-                # (parquet files may already have proper datetime types)
-                datetime_cols = []
-                for col_name in ["created_at", "end_date"]:
-                    if col_name in markets_df.columns:
-                        col_dtype = markets_df[col_name].dtype
-                        if col_dtype == pl.String or col_dtype == pl.Utf8:
-                            datetime_cols.append(pl.col(col_name).str.to_datetime())
-                
-                if datetime_cols:
-                    markets_df = markets_df.with_columns(datetime_cols)
-                
-                # Fix timestamp corruption
-                for col in markets_df.columns:
-                    if any(x in col.lower() for x in ["timestamp", "trade", "created_at", "end_date"]):
-                        if markets_df[col].dtype == pl.Datetime or markets_df[col].dtype == pl.Date:
-                            if not markets_df[col].is_empty() and markets_df[col].max() < datetime(2020, 1, 1):
-                                markets_df = markets_df.with_columns((pl.col(col).cast(pl.Int64) * 1000).cast(pl.Datetime))
-                                
-                        # Enforce 2020+ constraint (replace placeholders/zeros with null)
-                        if markets_df[col].dtype == pl.Datetime or markets_df[col].dtype == pl.Date:
-                             markets_df = markets_df.with_columns(
-                                 pl.when(pl.col(col) < datetime(2020, 1, 1))
-                                 .then(None)
-                                 .otherwise(pl.col(col))
-                                 .alias(col)
-                             )
-                
+                # Load with lazy scan, reading only the columns used downstream.
+                # created_at/end_date are stored as parquet timestamps and are
+                # not parsed here; convert on demand if a string file turns up.
+                markets_lf = pl.scan_parquet(markets_path).select(
+                    cs.by_name(*MARKETS_COLUMNS, require_all=False)
+                )
+                markets_df = _fix_timestamp_columns(markets_lf).collect()
+                markets_df = _to_categorical(markets_df, MARKETS_CATEGORICAL_COLUMNS)
                 data["markets"] = markets_df
                 print(f"Loaded {len(markets_df)} markets.")
 
             if odds_path.exists():
-                odds_df = pl.scan_parquet(odds_path).collect()
-                
-                # Fix timestamp corruption
-                for col in odds_df.columns:
-                    if any(x in col.lower() for x in ["timestamp", "trade", "created_at", "end_date"]):
-                        if odds_df[col].dtype == pl.Datetime or odds_df[col].dtype == pl.Date:
-                            if not odds_df[col].is_empty() and odds_df[col].max() < datetime(2020, 1, 1):
-                                odds_df = odds_df.with_columns((pl.col(col).cast(pl.Int64) * 1000).cast(pl.Datetime))
-                                
-                        # Enforce 2020+ constraint (replace placeholders/zeros with null)
-                        if odds_df[col].dtype == pl.Datetime or odds_df[col].dtype == pl.Date:
-                             odds_df = odds_df.with_columns(
-                                 pl.when(pl.col(col) < datetime(2020, 1, 1))
-                                 .then(None)
-                                 .otherwise(pl.col(col))
-                                 .alias(col)
-                             )
-                            
-                data["odds"] = odds_df
-                print(f"Loaded {len(odds_df)} odds history records.")
+                # Kept lazy: the odds history is large and only aggregated,
+                # so nothing is materialized until a query is collected.
+                data["odds"] = _fix_timestamp_columns(pl.scan_parquet(odds_path))
+                row_counts["odds"] = _row_count_query(odds_path).collect().item()
+                print(f"Found {row_counts['odds']} odds history records.")
 
             if summary_path.exists():
-                summary_df = pl.scan_parquet(summary_path).collect()
-                
-                # Fix timestamp corruption
-                for col in summary_df.columns:
-                    if any(x in col.lower() for x in ["timestamp", "trade", "created_at", "end_date"]):
-                        if summary_df[col].dtype == pl.Datetime or summary_df[col].dtype == pl.Date:
-                            if not summary_df[col].is_empty() and summary_df[col].max() < datetime(2020, 1, 1):
-                                summary_df = summary_df.with_columns((pl.col(col).cast(pl.Int64) * 1000).cast(pl.Datetime))
-                                
-                        # Enforce 2020+ constraint (replace placeholders/zeros with null)
-                        if summary_df[col].dtype == pl.Datetime or summary_df[col].dtype == pl.Date:
-                             summary_df = summary_df.with_columns(
-                                 pl.when(pl.col(col) < datetime(2020, 1, 1))
-                                 .then(None)
-                                 .otherwise(pl.col(col))
-                                 .alias(col)
-                             )
-                            
-                data["summary"] = summary_df
-                print(f"Loaded {len(summary_df)} summary records.")
+                data["summary"] = _fix_timestamp_columns(pl.scan_parquet(summary_path))
+                row_counts["summary"] = _row_count_query(summary_path).collect().item()
+                print(f"Found {row_counts['summary']} summary records.")
+
+            if row_counts:
+                # Counted once here and reused by the summary
+                data["row_counts"] = pl.DataFrame([row_counts])
 
         return data if data else None
     except Exception as e:
@@ -218,12 +342,33 @@ def load_polymarket_data(datadir: Path) -> Optional[dict[str, pl.DataFrame]]:
 # --- Bitcoin Analysis Functions ---
 
 
-def analyze_btc_metrics(df: pl.DataFrame) -> None:
+def _correlation_matrix(df: pl.DataFrame, columns: list[str]) -> np.ndarray:
+    """
+    Compute the Pearson correlation matrix of the given columns.
+
+    Rows with a missing value in any of the columns are dropped, then the
+    standardized matrix is multiplied by its transpose in a single BLAS call.
+
+    Args:
+        df: Polars DataFrame containing the columns
+        columns: Numeric columns to correlate
+
+    Returns:
+        Square ndarray of correlations, ordered like ``columns``
+    """
+    values = df.select(columns).to_numpy().astype(np.float64, copy=False)
+    values = values[~np.isnan(values).any(axis=1)]
+    values = (values - values.mean(axis=0)) / values.std(axis=0)
+    return (values.T @ values) / len(values)
+
+
+def analyze_btc_metrics(df: pl.DataFrame, fig: Optional["Figure"] = None) -> None:
     """
     Analyze Bitcoin metrics and generate summary statistics.
 
     Args:
         df: Polars DataFrame containing Bitcoin data
+        fig: Optional figure to reuse for the heatmap (cleared before drawing)
     """
     print("\n--- Bitcoin Data Summary ---")
 
@@ -240,120 +385,291 @@ def analyze_btc_metrics(df: pl.DataFrame) -> None:
     available_corr_cols = [col for col in correlation_cols if col in df.columns]
 
     if len(available_corr_cols) >= 2:
-        corr_df = df.select(available_corr_cols).to_pandas()
-        corr = corr_df.corr()
-
-        plt.figure(figsize=(8, 6))
-        sns.heatmap(corr, annot=True, cmap="coolwarm", fmt=".2f")
-        plt.title("Correlation of Bitcoin Metrics")
-        plt.tight_layout()
-        plt.savefig(PLOTS_DIR / "btc_correlation_matrix.png")
-        print("Saved btc_correlation_matrix.png")
-        plt.close()
+        corr = _correlation_matrix(df, available_corr_cols)
+
+        with _pyplot().rc_context(PLOT_RC_PARAMS):
+            plot_fig, ax = _prepare_axes(fig, figsize=(8, 6))
+            image = ax.imshow(corr, cmap="coolwarm", vmin=-1, vmax=1)
+            plot_fig.colorbar(image, ax=ax)
+            ticks = range(len(available_corr_cols))
+            ax.set_xticks(ticks, labels=available_corr_cols)
+            ax.set_yticks(ticks, labels=available_corr_cols)
+            for i in ticks:
+                for j in ticks:
+                    ax.text(
+                        j,
+                        i,
+                        f"{corr[i, j]:.2f}",
+                        ha="center",
+                        va="center",
+                        color="white" if abs(corr[i, j]) > 0.5 else "black",
+                    )
+            ax.set_title("Correlation of Bitcoin Metrics")
+            plot_fig.tight_layout()
+            plot_fig.savefig(BTC_CORR_PNG, **SAVEFIG_KWARGS)
+        print(f"Saved {BTC_CORR_PNG.name}")
+        if fig is None:
+            _pyplot().close(plot_fig)
 
 
 # --- Polymarket Analysis Functions ---
 
 
-def analyze_polymarket_summary(data: dict[str, pl.DataFrame]) -> None:
+def summarize_odds_by_market(odds: Union[pl.DataFrame, pl.LazyFrame]) -> pl.DataFrame:
+    """
+    Aggregate the odds history into per-outcome price statistics.
+
+    Each market has one price series per outcome token (e.g. Yes/No), so rows
+    are grouped by ``market_id`` and ``token_id`` when the token column is
+    present; mixing complementary token prices would make the statistics
+    meaningless. The group-by runs lazily on the streaming engine, so only the
+    key and ``price`` columns are read and the odds history is never
+    materialized. This is a full column scan, so it is not part of the default
+    ``main()`` run.
+
+    Args:
+        odds: Odds history DataFrame/LazyFrame with 'market_id', 'price' and
+            optionally 'token_id'
+
+    Returns:
+        DataFrame with one row per market (and token): snapshot count and
+        min/max/mean price
+    """
+    odds = odds.lazy()
+    keys = ["market_id"]
+    if "token_id" in odds.collect_schema().names():
+        keys.append("token_id")
+    return (
+        odds.group_by(keys)
+        .agg(
+            pl.len().alias("snapshots"),
+            pl.col("price").min().alias("min_price"),
+            pl.col("price").max().alias("max_price"),
+            pl.col("price").mean().alias("mean_price"),
+        )
+        .collect(streaming=True)
+    )
+
+
+def analyze_polymarket_summary(
+    data: dict[str, Union[pl.DataFrame, pl.LazyFrame]],
+) -> None:
     """
     Analyze Polymarket data and generate summary statistics.
 
     Args:
-        data: Dictionary containing Polymarket DataFrames
+        data: Dictionary containing Polymarket DataFrames/LazyFrames as
+            returned by ``load_polymarket_data``
     """
     print("\n--- Polymarket Data Summary ---")
 
     markets_df = data.get("markets")
     if markets_df is not None:
-        print(f"Total Markets: {len(markets_df)}")
+        n_markets = len(markets_df)
+        print(f"Total Markets: {n_markets}")
 
+        # Compute every market aggregate in one query (one pass per column)
+        aggs = []
         if "active" in markets_df.columns:
-            active_count = markets_df["active"].sum()
+            # Boolean sum is a popcount over the 1-bit Arrow bitmap; no
+            # byte-per-bool NumPy array is materialized
+            aggs.append(pl.col("active").sum().alias("active_count"))
+        if "volume" in markets_df.columns:
+            aggs.append(pl.col("volume").sum().alias("total_volume"))
+            aggs.append(pl.col("volume").count().alias("volume_count"))
+        stats = markets_df.select(aggs).row(0, named=True) if aggs else {}
+
+        if "active_count" in stats:
+            active_count = stats["active_count"]
             print(f"Active Markets: {active_count}")
-            print(f"Closed Markets: {len(markets_df) - active_count}")
+            print(f"Closed Markets: {n_markets - active_count}")
 
-        if "volume" in markets_df.columns:
-            total_volume = markets_df["volume"].sum()
-            avg_volume = markets_df["volume"].mean()
+        if "total_volume" in stats:
+            total_volume = stats["total_volume"]
+            # Mean over non-null volumes, derived from the sum already computed
+            volume_count = stats["volume_count"]
+            avg_volume = total_volume / volume_count if volume_count else 0.0
             print(f"Total Volume: ${total_volume:,.2f}")
             print(f"Average Volume per Market: ${avg_volume:,.2f}")
 
-    odds_df = data.get("odds")
-    if odds_df is not None:
-        print(f"Total Odds History Records: {len(odds_df):,}")
-
-    summary_df = data.get("summary")
-    if summary_df is not None and "trade_count" in summary_df.columns:
-        total_trades = summary_df["trade_count"].sum()
-        print(f"Total Trades: {total_trades:,}")
+    odds_lf = data.get("odds")
+    if odds_lf is not None:
+        # Reuse the count taken at load time from the parquet metadata;
+        # counting the timestamp-repaired frame would read a column
+        row_counts = data.get("row_counts")
+        if row_counts is not None and "odds" in row_counts.columns:
+            odds_count = row_counts["odds"].item()
+        else:
+            odds_count = odds_lf.lazy().select(pl.len()).collect().item()
+        print(f"Total Odds History Records: {odds_count:,}")
+
+    summary_lf = data.get("summary")
+    if summary_lf is not None:
+        summary_lf = summary_lf.lazy()
+        if "trade_count" in summary_lf.collect_schema().names():
+            # Streaming engine reads only trade_count, batch by batch
+            total_trades = (
+                summary_lf.select(pl.col("trade_count").sum())
+                .collect(streaming=True)
+                .item()
+            )
+            print(f"Total Trades: {total_trades:,}")
 
 
 # --- Visualization Functions ---
 
 
-def plot_btc_price(df: pl.DataFrame) -> None:
+@cache
+def _pyplot() -> ModuleType:
+    """
+    Import matplotlib.pyplot on first use.
+
+    Deferring the import keeps ``import eda_starter_template`` cheap for
+    callers that only need the loaders.
+
+    Returns:
+        The matplotlib.pyplot module
+    """
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def _prepare_axes(
+    fig: Optional["Figure"], figsize: tuple[float, float]
+) -> tuple["Figure", "Axes"]:
+    """
+    Get a single-axes figure to draw on, reusing ``fig`` when one is given.
+
+    A reused figure is cleared (including any colorbar axes) and resized, which
+    avoids allocating a new figure and canvas for every plot.
+
+    Args:
+        fig: Figure to reuse, or None to create a new one
+        figsize: Figure size in inches
+
+    Returns:
+        Tuple of (figure, axes)
+    """
+    if fig is None:
+        fig = _pyplot().figure(figsize=figsize)
+    else:
+        fig.clf()
+        fig.set_size_inches(figsize)
+    return fig, fig.add_subplot()
+
+
+def _downsample_minmax(
+    df: pl.DataFrame, value_col: str, max_points: int = PLOT_MAX_POINTS
+) -> pl.DataFrame:
+    """
+    Downsample a time series for plotting while preserving its extremes.
+
+    Rows are split into consecutive buckets and only the minimum and maximum
+    row of ``value_col`` in each bucket are kept, so peaks and troughs stay
+    visible at a fraction of the point count.
+
+    Args:
+        df: Polars DataFrame ordered by time
+        value_col: Column whose extremes are preserved
+        max_points: Approximate maximum number of rows to return
+
+    Returns:
+        DataFrame with at most ~``max_points`` rows, in the original order
+    """
+    if len(df) <= max_points:
+        return df
+
+    # Two rows per bucket; at least one bucket so max_points < 2 can't divide by zero
+    bucket_size = -(-len(df) // max(1, max_points // 2))
+    position = pl.int_range(pl.len()).over("_bucket")
+    return (
+        df.with_columns((pl.int_range(pl.len()) // bucket_size).alias("_bucket"))
+        .filter(
+            (position == pl.col(value_col).arg_min().over("_bucket"))
+            | (position == pl.col(value_col).arg_max().over("_bucket"))
+        )
+        .drop("_bucket")
+    )
+
+
+def plot_btc_price(df: pl.DataFrame, fig: Optional["Figure"] = None) -> None:
     """
     Plot Bitcoin price history over time.
 
     Args:
         df: Polars DataFrame containing Bitcoin data with 'time' and 'PriceUSD' columns
+        fig: Optional figure to reuse (cleared before drawing)
     """
     if "time" not in df.columns or "PriceUSD" not in df.columns:
         print("Required columns 'time' or 'PriceUSD' not found in Bitcoin data.")
         return
 
-    # Convert to pandas for plotting (Polars doesn't have direct matplotlib integration)
-    plot_df = df.select(["time", "PriceUSD"]).to_pandas()
-
-    plt.figure(figsize=(12, 6))
-    plt.plot(plot_df["time"], plot_df["PriceUSD"], label="BTC Price (USD)")
-    plt.title("Bitcoin Price History")
-    plt.xlabel("Date")
-    plt.ylabel("Price (USD)")
-    plt.legend()
-    plt.grid(True)
-    plt.tight_layout()
-    plt.savefig(PLOTS_DIR / "btc_price_history.png")
-    print("Saved btc_price_history.png")
-    plt.close()
-
-
-def plot_polymarket_volume(df: pl.DataFrame) -> None:
+    # Keep the per-bucket extremes only; a 12-inch plot can't show more points
+    plot_df = _downsample_minmax(df.select(["time", "PriceUSD"]), "PriceUSD")
+
+    # Hand matplotlib NumPy arrays straight from Polars (no pandas conversion)
+    times = plot_df["time"].to_numpy()
+    prices = plot_df["PriceUSD"].to_numpy()
+
+    with _pyplot().rc_context(PLOT_RC_PARAMS):
+        plot_fig, ax = _prepare_axes(fig, figsize=(12, 6))
+        ax.plot(times, prices, label="BTC Price (USD)")
+        ax.set_title("Bitcoin Price History")
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Price (USD)")
+        ax.legend()
+        ax.grid(True)
+        plot_fig.tight_layout()
+        plot_fig.savefig(BTC_PRICE_PNG, **SAVEFIG_KWARGS)
+    print(f"Saved {BTC_PRICE_PNG.name}")
+    if fig is None:
+        _pyplot().close(plot_fig)
+
+
+def plot_polymarket_volume(df: pl.DataFrame, fig: Optional["Figure"] = None) -> None:
     """
     Plot top 10 Polymarket categories by volume.
 
     Args:
         df: Polars DataFrame containing Polymarket markets data
+        fig: Optional figure to reuse (cleared before drawing)
     """
     if "volume" not in df.columns or "category" not in df.columns:
         print("Columns 'volume' or 'category' not found in Polymarket data.")
         return
 
-    # Use Polars to compute top categories
+    # Run the aggregation as a lazy query so only the two needed columns are
+    # touched; top_k selects the 10 largest groups without sorting them all,
+    # and only those 10 rows are sorted for display
     top_cats = (
-        df.group_by("category")
+        df.lazy()
+        .group_by("category")
         .agg(pl.col("volume").sum())
+        .top_k(10, by="volume")
         .sort("volume", descending=True)
-        .head(10)
+        .with_columns(pl.col("category").cast(pl.String))
+        .collect()
     )
 
     if len(top_cats) == 0:
         print("No data available for volume by category plot.")
         return
 
-    # Convert to pandas for seaborn plotting
-    plot_df = top_cats.to_pandas()
-
-    plt.figure(figsize=(10, 6))
-    sns.barplot(x=plot_df["volume"], y=plot_df["category"])
-    plt.title("Top 10 Polymarket Categories by Volume")
-    plt.xlabel("Total Volume")
-    plt.ylabel("Category")
-    plt.tight_layout()
-    plt.savefig(PLOTS_DIR / "polymarket_volume_by_category.png")
-    print("Saved polymarket_volume_by_category.png")
-    plt.close()
+    with _pyplot().rc_context(PLOT_RC_PARAMS):
+        plot_fig, ax = _prepare_axes(fig, figsize=(10, 6))
+        labels = top_cats["category"].fill_null("(none)").to_list()
+        ax.barh(labels, top_cats["volume"].to_numpy())
+        # Largest category on top
+        ax.invert_yaxis()
+        ax.set_title("Top 10 Polymarket Categories by Volume")
+        ax.set_xlabel("Total Volume")
+        ax.set_ylabel("Category")
+        plot_fig.tight_layout()
+        plot_fig.savefig(POLY_VOLUME_PNG, **SAVEFIG_KWARGS)
+    print(f"Saved {POLY_VOLUME_PNG.name}")
+    if fig is None:
+        _pyplot().close(plot_fig)
 
 
 # --- Main Execution ---
@@ -361,20 +677,33 @@ def plot_polymarket_volume(df: pl.DataFrame) -> None:
 
 def main() -> None:
     """Main execution function for EDA workflow."""
+    import matplotlib
+
+    # Headless run: render straight to PNG without initializing a GUI backend
+    matplotlib.use("Agg")
+    plt = _pyplot()
+
     # Track overall memory usage
     initial_memory = get_memory_usage_mb()
     print(f"\n[Memory] Initial memory usage: {format_memory(initial_memory)}\n")
 
-    # Load data using lazy evaluation
-    btc_df = load_bitcoin_data(COINMETRICS_PATH)
-    poly_data = load_polymarket_data(POLYMARKET_DIR)
+    # Load data using lazy evaluation; both loads are I/O bound and Polars
+    # releases the GIL while reading, so run them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        btc_future = executor.submit(load_bitcoin_data, COINMETRICS_PATH)
+        poly_future = executor.submit(load_polymarket_data, POLYMARKET_DIR)
+        btc_df = btc_future.result()
+        poly_data = poly_future.result()
+
+    # One figure is shared by all plots and cleared between them
+    fig = plt.figure()
 
     # Analyze Bitcoin data
     if btc_df is not None:
         with track_memory("analyzing Bitcoin metrics"):
-            analyze_btc_metrics(btc_df)
+            analyze_btc_metrics(btc_df, fig=fig)
         with track_memory("plotting Bitcoin price"):
-            plot_btc_price(btc_df)
+            plot_btc_price(btc_df, fig=fig)
 
     # Analyze Polymarket data
     if poly_data is not None:
@@ -382,7 +711,9 @@ def main() -> None:
             analyze_polymarket_summary(poly_data)
         if "markets" in poly_data:
             with track_memory("plotting Polymarket volume"):
-                plot_polymarket_volume(poly_data["markets"])
+                plot_polymarket_volume(poly_data["markets"], fig=fig)
+
+    plt.close(fig)
 
     # Final memory summary
     final_memory = get_memory_usage_mb()
@@ -0,0 +1,372 @@
+"""Unit tests for eda/eda_starter_template.py.
+
+Covers:
+1. Coin Metrics CSV loading (column projection and Feather cache)
+2. Polymarket loading (lazy odds/summary tables, timestamp repair)
+3. Bitcoin metric correlations
+4. Per-market odds aggregation
+5. Plot downsampling and PNG output
+"""
+
+import os
+from datetime import datetime
+
+import numpy as np
+import polars as pl
+import pytest
+
+import eda.eda_starter_template as eda
+from eda.eda_starter_template import (
+    BTC_COLUMNS,
+    _correlation_matrix,
+    _downsample_minmax,
+    analyze_polymarket_summary,
+    load_bitcoin_data,
+    load_polymarket_data,
+    summarize_odds_by_market,
+)
+
+
+@pytest.fixture
+def coinmetrics_csv(tmp_path):
+    """Write a small Coin Metrics-style CSV with extra unused columns."""
+    df = pl.DataFrame(
+        {
+            "time": ["2024-01-01", "2024-01-02", "2024-01-03"],
+            "PriceUSD": [42000.0, 43000.0, None],
+            "CapMrktCurUSD": [8.2e11, 8.4e11, 8.3e11],
+            "HashRate": [5.1e8, 5.2e8, 5.3e8],
+            "TxCnt": [400000.0, 410000.0, 420000.0],
+            "AdrActCnt": [900000.0, 910000.0, 920000.0],
+            "FeeTotNtv": [25.0, 26.0, 27.0],
+        }
+    )
+    path = tmp_path / "coinmetrics_btc.csv"
+    df.write_csv(path)
+    return path
+
+
+@pytest.fixture
+def polymarket_dir(tmp_path):
+    """Write small Polymarket parquet files, with corrupted odds timestamps."""
+    pl.DataFrame(
+        {
+            "market_id": ["m1", "m2", "m3"],
+            "category": ["Crypto", "Politics", "Crypto"],
+            "volume": [100.0, 250.0, 50.0],
+            "active": [True, False, True],
+        }
+    ).write_parquet(tmp_path / "finance_politics_markets.parquet")
+
+    # One price series per (market, outcome token). Millisecond epoch values
+    # are stored as microseconds (1970 dates), plus a zero placeholder.
+    corrupted = pl.Series(
+        [1_700_000_000_000, 1_710_000_000_000, 1_700_000_000_000, 1_710_000_000_000, 0]
+    ).cast(pl.Datetime("us"))
+    pl.DataFrame(
+        {
+            "market_id": ["m1", "m1", "m1", "m1", "m2"],
+            "token_id": ["m1-yes", "m1-yes", "m1-no", "m1-no", "m2-yes"],
+            "timestamp": corrupted,
+            "price": [0.9, 0.8, 0.1, 0.2, 0.5],
+        }
+    ).write_parquet(tmp_path / "finance_politics_odds_history.parquet")
+
+    pl.DataFrame({"market_id": ["m1", "m2"], "trade_count": [10, 32]}).write_parquet(
+        tmp_path / "finance_politics_summary.parquet"
+    )
+    return tmp_path
+
+
+# -----------------------------------------------------------------------------
+# Bitcoin Data Loading
+# -----------------------------------------------------------------------------
+
+
+def test_load_bitcoin_data_selects_required_columns(coinmetrics_csv):
+    """Test that only BTC_COLUMNS are loaded and time is parsed."""
+    df = load_bitcoin_data(coinmetrics_csv)
+
+    assert df is not None
+    assert df.columns == BTC_COLUMNS
+    assert df["time"].dtype == pl.Datetime
+    assert len(df) == 3
+
+
+def test_load_bitcoin_data_keeps_integer_counts_wide(tmp_path):
+    """Test that integer counts stay Int64 so sums cannot overflow."""
+    path = tmp_path / "coinmetrics_btc.csv"
+    pl.DataFrame(
+        {
+            "time": ["2024-01-01", "2024-01-02", "2024-01-03"],
+            "PriceUSD": [42000.0, 43000.0, 44000.0],
+            "CapMrktCurUSD": [8.2e11, 8.4e11, 8.6e11],
+            "HashRate": [5.1e8, 5.2e8, 5.3e8],
+            "TxCnt": [1_500_000_000, 1_500_000_000, 1_500_000_000],
+        }
+    ).write_csv(path)
+
+    df = load_bitcoin_data(path)
+    cached = load_bitcoin_data(path)  # served from the Feather cache
+
+    assert df["TxCnt"].dtype == pl.Int64
+    assert df["TxCnt"].sum() == 4_500_000_000
+    assert cached["TxCnt"].dtype == pl.Int64
+
+
+def test_load_bitcoin_data_writes_and_reuses_cache(coinmetrics_csv):
+    """Test that the Feather cache is written and then used on reload."""
+    cache_path = coinmetrics_csv.with_suffix(".feather")
+
+    first = load_bitcoin_data(coinmetrics_csv)
+    assert cache_path.exists()
+
+    # Overwrite the cache with a marker frame to prove it is read back
+    marker = first.with_columns(pl.lit(1.0).alias("PriceUSD"))
+    marker.write_ipc(cache_path)
+
+    second = load_bitcoin_data(coinmetrics_csv)
+    assert second["PriceUSD"].to_list() == [1.0, 1.0, 1.0]
+
+
+def test_load_bitcoin_data_ignores_stale_cache(coinmetrics_csv):
+    """Test that a cache older than the CSV is rebuilt."""
+    cache_path = coinmetrics_csv.with_suffix(".feather")
+    first = load_bitcoin_data(coinmetrics_csv)
+    first.with_columns(pl.lit(1.0).alias("PriceUSD")).write_ipc(cache_path)
+
+    # Make the CSV newer than the cache
+    stat = cache_path.stat()
+    os.utime(coinmetrics_csv, (stat.st_atime + 10, stat.st_mtime + 10))
+
+    reloaded = load_bitcoin_data(coinmetrics_csv)
+    assert reloaded["PriceUSD"].to_list() == [42000.0, 43000.0, None]
+
+
+def test_load_bitcoin_data_ignores_cache_with_other_columns(coinmetrics_csv):
+    """Test that a fresh cache whose columns differ from BTC_COLUMNS is rebuilt."""
+    cache_path = coinmetrics_csv.with_suffix(".feather")
+    first = load_bitcoin_data(coinmetrics_csv)
+    first.select(["time", "PriceUSD"]).write_ipc(cache_path)
+
+    reloaded = load_bitcoin_data(coinmetrics_csv)
+
+    assert reloaded.columns == BTC_COLUMNS
+    assert list(pl.read_ipc_schema(cache_path)) == BTC_COLUMNS
+
+
+def test_load_bitcoin_data_reuses_cache_when_csv_lacks_a_column(tmp_path, capsys):
+    """Test that a CSV missing some BTC_COLUMNS is still served from cache."""
+    path = tmp_path / "coinmetrics_btc.csv"
+    pl.DataFrame(
+        {
+            "time": ["2024-01-01", "2024-01-02"],
+            "PriceUSD": [42000.0, 43000.0],
+            "HashRate": [5.1e8, 5.2e8],
+        }
+    ).write_csv(path)
+
+    first = load_bitcoin_data(path)
+    second = load_bitcoin_data(path)
+
+    assert "from cache" in capsys.readouterr().out
+    assert second.equals(first)
+
+
+def test_load_bitcoin_data_cache_rebuild_keeps_earlier_frames_valid(coinmetrics_csv):
+    """Test that rebuilding the cache does not invalidate frames read from it."""
+    load_bitcoin_data(coinmetrics_csv)
+    cached = load_bitcoin_data(coinmetrics_csv)
+
+    # Rewrite the CSV with new prices and make it newer than the cache
+    pl.read_csv(coinmetrics_csv).with_columns(pl.lit(1.0).alias("PriceUSD")).write_csv(
+        coinmetrics_csv
+    )
+    stat = coinmetrics_csv.with_suffix(".feather").stat()
+    os.utime(coinmetrics_csv, (stat.st_atime + 10, stat.st_mtime + 10))
+
+    rebuilt = load_bitcoin_data(coinmetrics_csv)
+
+    assert rebuilt["PriceUSD"].to_list() == [1.0, 1.0, 1.0]
+    assert cached["PriceUSD"].to_list() == [42000.0, 43000.0, None]
+
+
+# -----------------------------------------------------------------------------
+# Polymarket Data Loading
+# -----------------------------------------------------------------------------
+
+
+def test_load_polymarket_data_keeps_large_tables_lazy(polymarket_dir):
+    """Test that odds history and summary are returned as LazyFrames."""
+    data = load_polymarket_data(polymarket_dir)
+
+    assert isinstance(data["markets"], pl.DataFrame)
+    assert isinstance(data["odds"], pl.LazyFrame)
+    assert isinstance(data["summary"], pl.LazyFrame)
+
+
+def test_load_polymarket_data_repairs_odds_timestamps(polymarket_dir):
+    """Test that the lazy timestamp fix rescales and nulls placeholders."""
+    odds = load_polymarket_data(polymarket_dir)["odds"].collect()
+
+    timestamps = odds["timestamp"].to_list()
+    assert timestamps[0] == datetime(2023, 11, 14, 22, 13, 20)
+    assert timestamps[1] == datetime(2024, 3, 9, 16, 0)
+    assert timestamps[4] is None
+
+
+def test_load_polymarket_data_counts_rows_from_metadata(polymarket_dir):
+    """Test that row counts use the FAST COUNT plan and are kept for reuse."""
+    odds_path = polymarket_dir / "finance_politics_odds_history.parquet"
+    assert "FAST COUNT" in eda._row_count_query(odds_path).explain()
+
+    row_counts = load_polymarket_data(polymarket_dir)["row_counts"]
+    assert row_counts.row(0, named=True) == {"odds": 5, "summary": 2}
+
+
+def test_load_polymarket_data_categorizes_market_category(polymarket_dir):
+    """Test that category becomes Categorical and volume stays Float64."""
+    markets = load_polymarket_data(polymarket_dir)["markets"]
+
+    assert set(markets.columns) == {"active", "volume", "category"}
+    assert markets["category"].dtype == pl.Categorical
+    assert markets["volume"].dtype == pl.Float64
+    assert markets["volume"].sum() == 400.0
+
+
+# -----------------------------------------------------------------------------
+# Bitcoin Analysis
+# -----------------------------------------------------------------------------
+
+
+def test_correlation_matrix_matches_numpy_corrcoef():
+    """Test the BLAS correlation against np.corrcoef, dropping null rows."""
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(200, 3))
+    values[:, 1] += values[:, 0]
+    df = pl.DataFrame(values, schema=["a", "b", "c"]).with_columns(
+        pl.when(pl.int_range(pl.len()) < 5).then(None).otherwise(pl.col("a")).alias("a")
+    )
+
+    corr = _correlation_matrix(df, ["a", "b", "c"])
+
+    expected = np.corrcoef(values[5:], rowvar=False)
+    np.testing.assert_allclose(corr, expected, atol=1e-12)
+
+
+# -----------------------------------------------------------------------------
+# Polymarket Analysis
+# -----------------------------------------------------------------------------
+
+
+def test_summarize_odds_by_market_groups_by_token(polymarket_dir):
+    """Test that odds statistics are computed per outcome token, not per market."""
+    odds = load_polymarket_data(polymarket_dir)["odds"]
+
+    summary = summarize_odds_by_market(odds).sort(["market_id", "token_id"])
+
+    assert summary["token_id"].to_list() == ["m1-no", "m1-yes", "m2-yes"]
+    assert summary["snapshots"].to_list() == [2, 2, 1]
+    assert summary["min_price"].to_list() == [0.1, 0.8, 0.5]
+    assert summary["max_price"].to_list() == [0.2, 0.9, 0.5]
+    np.testing.assert_allclose(summary["mean_price"].to_numpy(), [0.15, 0.85, 0.5])
+
+
+def test_summarize_odds_by_market_without_token_id():
+    """Test that odds without a token column are grouped by market only."""
+    odds = pl.LazyFrame({"market_id": ["m1", "m1", "m2"], "price": [0.4, 0.6, 0.5]})
+
+    summary = summarize_odds_by_market(odds).sort("market_id")
+
+    assert summary.columns[0] == "market_id"
+    assert "token_id" not in summary.columns
+    assert summary["snapshots"].to_list() == [2, 1]
+
+
+def test_analyze_polymarket_summary_counts(polymarket_dir, capsys):
+    """Test market, volume, odds and trade totals in the printed summary."""
+    analyze_polymarket_summary(load_polymarket_data(polymarket_dir))
+
+    out = capsys.readouterr().out
+    assert "Total Markets: 3" in out
+    assert "Active Markets: 2" in out
+    assert "Closed Markets: 1" in out
+    assert "Total Volume: $400.00" in out
+    assert "Average Volume per Market: $133.33" in out
+    assert "Total Odds History Records: 5" in out
+    assert "Total Trades: 42" in out
+
+
+# -----------------------------------------------------------------------------
+# Visualization
+# -----------------------------------------------------------------------------
+
+
+def test_downsample_minmax_keeps_extremes_and_order():
+    """Test that downsampling bounds row count but keeps global min/max."""
+    rng = np.random.default_rng(1)
+    values = rng.normal(size=10_000).cumsum()
+    df = pl.DataFrame({"i": np.arange(10_000), "v": values})
+
+    sampled = _downsample_minmax(df, "v", max_points=500)
+
+    assert len(sampled) <= 500
+    assert sampled["v"].max() == values.max()
+    assert sampled["v"].min() == values.min()
+    assert sampled["i"].is_sorted()
+    assert sampled.columns == ["i", "v"]
+
+
+def test_downsample_minmax_short_series_unchanged():
+    """Test that series below the limit are returned as-is."""
+    df = pl.DataFrame({"v": [3.0, 1.0, 2.0]})
+
+    assert _downsample_minmax(df, "v", max_points=10).equals(df)
+
+
+def test_downsample_minmax_tiny_limit_keeps_global_extremes():
+    """Test that max_points below 2 falls back to a single bucket."""
+    df = pl.DataFrame({"v": [3.0, 1.0, 5.0, 2.0]})
+
+    assert _downsample_minmax(df, "v", max_points=1)["v"].to_list() == [1.0, 5.0]
+
+
+def test_plot_functions_write_pngs(monkeypatch, tmp_path, coinmetrics_csv, polymarket_dir):
+    """Test that each plot function saves its PNG, with and without a shared figure."""
+    (tmp_path / "plots").mkdir()
+    for name in ("BTC_CORR_PNG", "BTC_PRICE_PNG", "POLY_VOLUME_PNG"):
+        monkeypatch.setattr(eda, name, tmp_path / "plots" / getattr(eda, name).name)
+    btc_df = load_bitcoin_data(coinmetrics_csv)
+    markets = load_polymarket_data(polymarket_dir)["markets"]
+
+    eda.analyze_btc_metrics(btc_df)
+    eda.plot_btc_price(btc_df)
+    fig = eda._pyplot().figure()
+    eda.plot_polymarket_volume(markets, fig=fig)
+    eda._pyplot().close(fig)
+
+    saved = sorted(p.name for p in (tmp_path / "plots").iterdir())
+    assert saved == [
+        "btc_correlation_matrix.png",
+        "btc_price_history.png",
+        "polymarket_volume_by_category.png",
+    ]
+
+
+def test_plot_functions_leave_global_rcparams_untouched(
+    monkeypatch, tmp_path, coinmetrics_csv
+):
+    """Test that the path-simplification settings are scoped to each plot."""
+    monkeypatch.setattr(eda, "BTC_PRICE_PNG", tmp_path / "btc_price_history.png")
+    rc_params = eda._pyplot().rcParams
+    # Non-default sentinels, so any global write by the plot code is detected;
+    # clearing the cache re-runs _pyplot's first-use path as well
+    monkeypatch.setitem(rc_params, "path.simplify_threshold", 0.25)
+    monkeypatch.setitem(rc_params, "agg.path.chunksize", 0)
+    eda._pyplot.cache_clear()
+
+    eda.plot_btc_price(load_bitcoin_data(coinmetrics_csv))
+
+    assert rc_params["path.simplify_threshold"] == 0.25
+    assert rc_params["agg.path.chunksize"] == 0
+    assert (tmp_path / "btc_price_history.png").exists()
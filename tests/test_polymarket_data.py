@@ -30,6 +30,8 @@ def test_polars_timestamps(polymarket_dir):
     assert data, "No Polymarket data found for Polars"
     
     for key, df in data.items():
+        if isinstance(df, pl.LazyFrame):
+            df = df.collect()
         for col in df.columns:
             if any(x in col.lower() for x in ["timestamp", "trade", "created_at", "end_date"]):
                 if df[col].dtype == pl.Datetime or df[col].dtype == pl.Date: